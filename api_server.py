@@ -2,6 +2,7 @@
 import argparse
 import asyncio
 import base64
+import gzip
 import logging
 import logging.handlers
 import os
@@ -116,8 +117,36 @@ worker_id = str(uuid.uuid4())[:6]
 logger = build_logger("controller", f"{SAVE_DIR}/controller.log")
 
 
-def load_image_from_base64(image):
-    return Image.open(BytesIO(base64.b64decode(image)))
+def load_binary_param(value):
+    # Multipart uploads arrive as raw bytes, JSON bodies as base64 strings
+    if isinstance(value, bytes):
+        return value
+    return base64.b64decode(value)
+
+
+FORM_PARAM_TYPES = {
+    "octree_resolution": int,
+    "num_inference_steps": int,
+    "guidance_scale": float,
+    "seed": int,
+    "face_count": int,
+    "texture": lambda value: value.lower() in ("1", "true", "yes"),
+}
+
+
+async def read_params(request: Request):
+    if not request.headers.get("content-type", "").startswith("multipart/form-data"):
+        return await request.json()
+    form = await request.form()
+    params = {}
+    for key, value in form.items():
+        if hasattr(value, "read"):
+            params[key] = await value.read()
+        elif key in FORM_PARAM_TYPES:
+            params[key] = FORM_PARAM_TYPES[key](value)
+        else:
+            params[key] = value
+    return params
 
 
 class ModelWorker:
@@ -161,7 +190,7 @@ class ModelWorker:
     def generate(self, uid, params):
         if 'image' in params:
             image = params["image"]
-            image = load_image_from_base64(image)
+            image = Image.open(BytesIO(load_binary_param(image)))
         else:
             if 'text' in params:
                 text = params["text"]
@@ -173,7 +202,10 @@ class ModelWorker:
         params['image'] = image
 
         if 'mesh' in params:
-            mesh = trimesh.load(BytesIO(base64.b64decode(params["mesh"])), file_type='glb')
+            mesh_data = load_binary_param(params["mesh"])
+            if params.get("mesh_encoding") == "gzip+base64":
+                mesh_data = gzip.decompress(mesh_data)
+            mesh = trimesh.load(BytesIO(mesh_data), file_type='glb')
         else:
             seed = params.get("seed", 1234)
             params['generator'] = torch.Generator(self.device).manual_seed(seed)
@@ -218,7 +250,7 @@ app.add_middleware(
 @app.post("/generate")
 async def generate(request: Request):
     logger.info("Worker generating...")
-    params = await request.json()
+    params = await read_params(request)
     uid = uuid.uuid4()
     try:
         file_path, uid = worker.generate(uid, params)
@@ -251,7 +283,7 @@ async def generate(request: Request):
 @app.post("/send")
 async def generate(request: Request):
     logger.info("Worker send...")
-    params = await request.json()
+    params = await read_params(request)
     uid = uuid.uuid4()
     threading.Thread(target=worker.generate, args=(uid, params,)).start()
     ret = {"uid": str(uid)}
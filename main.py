@@ -7,14 +7,224 @@ bl_info = {
     "description": "Generate/Texturing 3D models from images",
     "category": "3D View",
 }
-import base64
+import atexit
+import functools
+import hashlib
+import logging
+import mmap
 import os
 import tempfile
 import threading
+import uuid
+import zlib
+from urllib.parse import urlparse
+from array import array
 
 import bpy
 import requests
 from bpy.props import StringProperty, BoolProperty, IntProperty, FloatProperty
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Optional SIMD-accelerated encoder; same output as the stdlib one
+try:
+    from pybase64 import b64encode as _b64encode
+    HAS_PYBASE64 = True
+except ImportError:
+    from base64 import b64encode as _b64encode
+    HAS_PYBASE64 = False
+
+# Optional faster serializer for the large base64 JSON bodies
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    HAS_ORJSON = True
+except ImportError:
+    import json
+    HAS_ORJSON = False
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+
+logger = logging.getLogger("hunyuan3d")
+
+# Multiple of 3 so every chunk encodes without padding and the pieces concatenate
+# into the same string as a one-shot b64encode.
+B64_CHUNK_SIZE = 768 * 1024
+# (connect, read) seconds; generation itself can take several minutes
+REQUEST_TIMEOUT = (5, 600)
+JSON_HEADERS = {"Content-Type": "application/json"}
+# requests < 2.29 sends generator bodies over a raw connection that ignores both
+# timeout= and max_retries; from 2.29 urllib3 does the chunking with the timeout
+# applied. Elsewhere the body is joined and sent in one piece.
+STREAM_UPLOADS = tuple(int(part) for part in requests.__version__.split(".")[:2]) >= (2, 29)
+RESPONSE_CHUNK_SIZE = 1 << 20
+UPLOAD_CHUNK_SIZE = 1 << 20
+MESH_CACHE_SIZE = 4
+IMAGE_CACHE_SIZE = 4
+
+# Private directory created in register(); holds this process' reusable
+# export/response GLBs
+_SCRATCH_DIR = ""
+# Every scratch path handed out, removed when Blender exits
+_active_tempfiles = set()
+
+
+def _scratch_path(name, suffix=".glb"):
+    path = os.path.join(_SCRATCH_DIR, f"{name}_{os.getpid()}{suffix}")
+    _active_tempfiles.add(path)
+    return path
+
+
+def _cleanup_tempfiles():
+    global _SCRATCH_DIR
+    for path in list(_active_tempfiles):
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+    _active_tempfiles.clear()
+    if _SCRATCH_DIR:
+        try:
+            os.rmdir(_SCRATCH_DIR)
+        except OSError:
+            pass
+        _SCRATCH_DIR = ""
+
+
+def _b64_chunks(path, chunk_size=B64_CHUNK_SIZE, compress=False):
+    """Yield a file base64-encoded chunk by chunk, read from a read-only mmap.
+
+    With compress=True the bytes are gzipped on the fly before encoding. The
+    pieces concatenate into a single valid base64 string.
+    """
+    assert chunk_size % 3 == 0
+    compressor = zlib.compressobj(1, zlib.DEFLATED, 16 + zlib.MAX_WBITS) if compress else None
+    pending = bytearray()
+    with open(path, "rb") as file:
+        # mmap refuses empty files
+        if os.fstat(file.fileno()).st_size:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                for start in range(0, len(view), chunk_size):
+                    with view[start:start + chunk_size] as chunk:
+                        if compressor is None:
+                            yield _b64encode(chunk)
+                            continue
+                        # Only encode whole 3-byte groups so no padding lands mid-stream
+                        pending += compressor.compress(chunk)
+                    # The compressor may still be buffering; never yield empty
+                    # pieces, old requests would send them as the final chunk
+                    aligned = len(pending) - len(pending) % 3
+                    if not aligned:
+                        continue
+                    with memoryview(pending) as compressed:
+                        encoded = _b64encode(compressed[:aligned])
+                    del pending[:aligned]
+                    yield encoded
+    if compressor is not None:
+        pending += compressor.flush()
+        if pending:
+            yield _b64encode(pending)
+
+
+def _stream_b64(path, chunk_size=B64_CHUNK_SIZE, compress=False):
+    return b"".join(_b64_chunks(path, chunk_size, compress)).decode("ascii")
+
+
+def _json_body_chunks(payload, key, chunks):
+    """Yield payload as a JSON body whose `key` field is streamed from base64 chunks."""
+    head = _json_dumps(payload)
+    # payload always holds the scalar parameters, so splice in after them;
+    # base64 needs no JSON escaping. Every piece must be real bytes: urllib3
+    # 1.26 calls .encode() on any other chunk type. head may already carry the
+    # whole image, so it is not concatenated with the key prefix.
+    yield head[:-1]
+    yield b',"' + key.encode() + b'":"'
+    yield from (chunk for chunk in chunks if chunk)
+    yield b'"}'
+
+
+def _upload_body(chunks):
+    return chunks if STREAM_UPLOADS else b"".join(chunks)
+
+
+def _multipart_body(boundary, params, files):
+    """Yield a multipart/form-data body, reading the files chunk by chunk."""
+    for name, value in params.items():
+        yield (f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'
+               f'{value}\r\n').encode()
+    for name, path in files.items():
+        yield (f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{name}"\r\n'
+               'Content-Type: application/octet-stream\r\n\r\n').encode()
+        with open(path, "rb") as file:
+            while chunk := file.read(UPLOAD_CHUNK_SIZE):
+                yield chunk
+        yield b"\r\n"
+    yield f"--{boundary}--\r\n".encode()
+
+
+@functools.lru_cache(maxsize=IMAGE_CACHE_SIZE)
+def _cached_image_b64(path, mtime_ns, size):
+    # mtime and size only take part in the key, so an edited image is re-encoded
+    return _stream_b64(path)
+
+
+def _encoded_image(path):
+    st = os.stat(path)
+    return _cached_image_b64(path, st.st_mtime_ns, st.st_size)
+
+
+def _mesh_cache_key(objects, depsgraph):
+    """Fingerprint the selection from transforms and geometry without exporting it.
+
+    Hashes the evaluated meshes, since the export applies modifiers.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for obj in sorted(objects, key=lambda o: o.name):
+        digest.update(obj.name.encode())
+        digest.update(array('f', [v for row in obj.matrix_world for v in row]).tobytes())
+        if obj.type != 'MESH':
+            continue
+        obj_eval = obj.evaluated_get(depsgraph)
+        mesh = obj_eval.to_mesh()
+        try:
+            coords = array('f', [0.0]) * (len(mesh.vertices) * 3)
+            mesh.vertices.foreach_get("co", coords)
+            digest.update(coords.tobytes())
+            loops = array('i', [0]) * len(mesh.loops)
+            mesh.loops.foreach_get("vertex_index", loops)
+            digest.update(loops.tobytes())
+        finally:
+            obj_eval.to_mesh_clear()
+    return digest.hexdigest()
+
+
+def _redraw_view3d():
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+
+def post_generate(session, base_url, params, mesh_path=None, image_path=None):
+    """POST a generation request as multipart/form-data, streaming files as raw bytes.
+
+    Where STREAM_UPLOADS allows, the body is a generator, so requests sends
+    it with chunked transfer encoding while the files are still being read.
+    """
+    files = {}
+    if mesh_path:
+        files["mesh"] = mesh_path
+    if image_path:
+        files["image"] = image_path
+    boundary = uuid.uuid4().hex
+    return session.post(
+        f"{base_url}/generate",
+        data=_upload_body(_multipart_body(boundary, params, files)),
+        headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+        timeout=REQUEST_TIMEOUT,
+        stream=True,
+    )
 
 
 class Hunyuan3DProperties(bpy.types.PropertyGroup):
@@ -71,42 +281,27 @@ class Hunyuan3DProperties(bpy.types.PropertyGroup):
         description="Whether to generate texture for the 3D model",
         default=False
     )
+    use_multipart: BoolProperty(
+        name="Multipart Upload",
+        description="Upload mesh and image as raw multipart/form-data instead of base64 JSON",
+        default=False
+    )
 
 
-class Hunyuan3DOperator(bpy.types.Operator):
-    bl_idname = "object.generate_3d"
-    bl_label = "Generate 3D Model"
-    bl_description = "Generate a 3D model from text description, an image or a selected mesh"
-
-    job_id = ''
-    prompt = ""
-    api_url = ""
-    image_path = ""
-    octree_resolution = 256
-    num_inference_steps = 20
-    guidance_scale = 5.5
-    texture = False
-    selected_mesh_base64 = ""
-    selected_mesh = None
-
-    thread = None
-    task_finished = False
-
-    def modal(self, context, event):
-        if event.type in {'RIGHTMOUSE', 'ESC'}:
-            return {'CANCELLED'}
+class GenerationJob:
+    """One generation request, snapshotted from the scene properties.
 
-        if self.task_finished:
-            print("Threaded task completed")
-            self.task_finished = False
-            props = context.scene.gen_3d_props
-            props.is_processing = False
+    The operator finishes as soon as the worker thread starts, so the worker
+    only touches this object and hands its result back to the main thread
+    through a single bpy.app.timers callback.
+    """
 
-        return {'PASS_THROUGH'}
+    # Shared across runs so repeated generations reuse the pooled connection
+    _session = None
+    # mesh_cache_key -> gzip+base64 GLB bytes of a previous export, oldest first
+    _mesh_cache = {}
 
-    def invoke(self, context, event):
-        # 启动线程
-        props = context.scene.gen_3d_props
+    def __init__(self, props):
         self.prompt = props.prompt
         self.api_url = props.api_url
         self.image_path = props.image_path
@@ -114,153 +309,259 @@ class Hunyuan3DOperator(bpy.types.Operator):
         self.num_inference_steps = props.num_inference_steps
         self.guidance_scale = props.guidance_scale
         self.texture = props.texture
+        self.use_multipart = props.use_multipart
+        self.selected_mesh_name = ""
+        self.selected_mesh_base64 = ""
+        self.selected_mesh_glb_path = ""
+        self.mesh_cache_key = None
+        self.result_path = ""
+        self.error = ""
+
+    @classmethod
+    def get_session(cls):
+        if cls._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=2,
+                pool_maxsize=4,
+                max_retries=Retry(total=2, backoff_factor=0.3),
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            cls._session = session
+        return cls._session
+
+    def mesh_chunks(self):
+        """Yield the exported mesh as gzip+base64 chunks, caching the full encoding."""
+        # Grown in place and converted once at the end; cached as bytes since a
+        # cache hit is sent as a chunk and urllib3 1.26 only accepts bytes there
+        encoded = bytearray()
+        for piece in _b64_chunks(self.selected_mesh_glb_path, compress=True):
+            encoded += piece
+            yield piece
+        self._mesh_cache[self.mesh_cache_key] = bytes(encoded)
+        while len(self._mesh_cache) > MESH_CACHE_SIZE:
+            del self._mesh_cache[next(iter(self._mesh_cache))]
+
+    def generate_model(self):
+        logger.info("Generation Start")
+        base_url = self.api_url.rstrip('/')
+        session = self.get_session()
 
-        if self.prompt == "" and self.image_path == "":
+        try:
+            use_mesh = self.texture and bool(self.selected_mesh_glb_path or self.selected_mesh_base64)
+            # The operator has already checked that the image exists
+            use_image = bool(self.image_path)
+
+            payload = {
+                "octree_resolution": self.octree_resolution,
+                "num_inference_steps": self.num_inference_steps,
+                "guidance_scale": self.guidance_scale,
+                "texture": self.texture
+            }
+            if not use_image:
+                payload["text"] = self.prompt
+
+            task = 'Texturing' if use_mesh else 'Generation'
+            logger.info("Post %s with %s", task, 'Image' if use_image else 'Text')
+            if self.use_multipart:
+                response = post_generate(
+                    session, base_url, payload,
+                    mesh_path=self.selected_mesh_glb_path if use_mesh else None,
+                    image_path=self.image_path if use_image else None,
+                )
+            else:
+                if use_image:
+                    payload["image"] = _encoded_image(self.image_path)
+                if use_mesh:
+                    payload["mesh_encoding"] = "gzip+base64"
+                    # A cached mesh goes out as a single piece; otherwise the
+                    # exported mesh is encoded while it is being uploaded
+                    if self.selected_mesh_base64:
+                        mesh_chunks = [self.selected_mesh_base64]
+                    else:
+                        mesh_chunks = self.mesh_chunks()
+                    body = _upload_body(_json_body_chunks(payload, "mesh", mesh_chunks))
+                else:
+                    body = _json_dumps(payload)
+                response = session.post(
+                    f"{base_url}/generate",
+                    data=body,
+                    headers=JSON_HEADERS,
+                    timeout=REQUEST_TIMEOUT,
+                    stream=True,
+                )
+            logger.info("Post Done")
+
+            # Stream the GLB straight to a temporary file; closing the response
+            # hands the connection back to the session pool
+            with response:
+                if response.status_code != 200:
+                    self.error = f"Generation failed: {response.text}"
+                    return
+
+                # Download next to the final name and rename it into place, so a
+                # failed transfer never leaves a truncated GLB to be imported
+                result_path = _scratch_path("response")
+                partial_path = _scratch_path("response", ".glb.tmp")
+                with open(partial_path, "wb") as file:
+                    for chunk in response.iter_content(chunk_size=RESPONSE_CHUNK_SIZE):
+                        file.write(chunk)
+                os.replace(partial_path, result_path)
+                self.result_path = result_path
+
+        except Exception as e:
+            self.error = f"Error: {str(e)}"
+
+        finally:
+            self.selected_mesh_base64 = ""
+            self.selected_mesh_glb_path = ""
+            bpy.app.timers.register(self.finish)
+
+    def finish(self):
+        """Timer callback: integrate the result on the main thread."""
+        props = bpy.context.scene.gen_3d_props
+        props.is_processing = False
+        props.status_message = ""
+        # No modal operator is running any more, so nothing else redraws the panel
+        _redraw_view3d()
+
+        if self.error:
+            logger.error(self.error)
+            props.status_message = self.error
+            return None
+
+        bpy.ops.import_scene.gltf(filepath=self.result_path)
+
+        selected_mesh = bpy.data.objects.get(self.selected_mesh_name)
+        new_obj = bpy.context.selected_objects[0] if bpy.context.selected_objects else None
+        if new_obj and selected_mesh and self.texture:
+            new_obj.location = selected_mesh.location
+            new_obj.rotation_euler = selected_mesh.rotation_euler
+            new_obj.scale = selected_mesh.scale
+
+            selected_mesh.hide_set(True)
+            selected_mesh.hide_render = True
+
+        return None
+
+
+class Hunyuan3DOperator(bpy.types.Operator):
+    bl_idname = "object.generate_3d"
+    bl_label = "Generate 3D Model"
+    bl_description = "Generate a 3D model from text description, an image or a selected mesh"
+
+    def invoke(self, context, event):
+        props = context.scene.gen_3d_props
+        job = GenerationJob(props)
+
+        if job.prompt == "" and job.image_path == "":
             self.report({'WARNING'}, "Please enter some text or select an image first.")
             return {'FINISHED'}
 
+        blend_file_dir = os.path.dirname(bpy.data.filepath)
+        logger.debug("blend_file_dir %s", blend_file_dir)
+        logger.debug("image_path %s", job.image_path)
+        if job.image_path.startswith('//'):
+            job.image_path = job.image_path[2:]
+            job.image_path = os.path.join(blend_file_dir, job.image_path)
+
+        # Fail fast here rather than after a round-trip to the server
+        if job.image_path and not os.path.exists(job.image_path):
+            self.report({'ERROR'}, f"Image path does not exist {job.image_path}")
+            return {'CANCELLED'}
+        if urlparse(job.api_url).scheme not in ('http', 'https'):
+            self.report({'ERROR'}, f"Invalid API URL {job.api_url}")
+            return {'CANCELLED'}
+
+        selected_mesh = None
         for obj in context.selected_objects:
             if obj.type == 'MESH':
-                self.selected_mesh = obj
+                selected_mesh = obj
+                job.selected_mesh_name = obj.name
                 break
 
-        if self.selected_mesh:
-            temp_glb_file = tempfile.NamedTemporaryFile(delete=False, suffix=".glb")
-            temp_glb_file.close()
-            bpy.ops.export_scene.gltf(filepath=temp_glb_file.name, use_selection=True)
-            with open(temp_glb_file.name, "rb") as file:
-                mesh_data = file.read()
-            mesh_b64_str = base64.b64encode(mesh_data).decode()
-            os.unlink(temp_glb_file.name)
-            self.selected_mesh_base64 = mesh_b64_str
+        # The mesh is only uploaded for texturing, otherwise skip exporting it
+        if selected_mesh and job.texture and not job.use_multipart:
+            job.mesh_cache_key = _mesh_cache_key(context.selected_objects,
+                                                 context.evaluated_depsgraph_get())
+            job.selected_mesh_base64 = job._mesh_cache.get(job.mesh_cache_key, "")
+
+        if selected_mesh and job.texture and not job.selected_mesh_base64:
+            # Exporting has to happen on the main thread; encoding/uploading the
+            # file is left to the worker thread. The scratch file is overwritten
+            # by the next export rather than removed.
+            job.selected_mesh_glb_path = _scratch_path("export")
+            try:
+                # The server only reads the geometry and paints a new texture,
+                # so materials, cameras, lights and animation are left out
+                bpy.ops.export_scene.gltf(
+                    filepath=job.selected_mesh_glb_path,
+                    use_selection=True,
+                    export_apply=True,
+                    export_materials='NONE',
+                    export_cameras=False,
+                    export_lights=False,
+                    export_animations=False,
+                    export_extras=False,
+                )
+            except RuntimeError as e:
+                self.report({'ERROR'}, f"Could not export selected mesh: {e}")
+                return {'CANCELLED'}
 
         props.is_processing = True
 
-        blend_file_dir = os.path.dirname(bpy.data.filepath)
-        self.report({'INFO'}, f"blend_file_dir {blend_file_dir}")
-        self.report({'INFO'}, f"image_path {self.image_path}")
-        if self.image_path.startswith('//'):
-            self.image_path = self.image_path[2:]
-            self.image_path = os.path.join(blend_file_dir, self.image_path)
-
-        if self.selected_mesh and self.texture:
+        if selected_mesh and job.texture:
             props.status_message = "Texturing Selected Mesh...\n" \
                                    "This may take several minutes depending \n on your GPU power."
         else:
-            mesh_type = 'Textured Mesh' if self.texture else 'White Mesh'
-            prompt_type = 'Text Prompt' if self.prompt else 'Image'
+            mesh_type = 'Textured Mesh' if job.texture else 'White Mesh'
+            prompt_type = 'Text Prompt' if job.prompt else 'Image'
             props.status_message = f"Generating {mesh_type} with {prompt_type}...\n" \
                                    "This may take several minutes depending \n on your GPU power."
 
-        self.thread = threading.Thread(target=self.generate_model)
-        self.thread.start()
+        threading.Thread(target=job.generate_model, daemon=True).start()
+        return {'FINISHED'}
 
-        wm = context.window_manager
-        wm.modal_handler_add(self)
-        return {'RUNNING_MODAL'}
 
-    def generate_model(self):
-        self.report({'INFO'}, f"Generation Start")
-        base_url = self.api_url.rstrip('/')
+class Hunyuan3DClearCacheOperator(bpy.types.Operator):
+    bl_idname = "object.hunyuan3d_clear_cache"
+    bl_label = "Clear Upload Cache"
+    bl_description = "Forget cached mesh and image uploads so they are encoded again"
 
-        try:
-            if self.selected_mesh_base64 and self.texture:
-                if self.image_path and os.path.exists(self.image_path):
-                    self.report({'INFO'}, f"Post Texturing with Image")
-                    
-                    with open(self.image_path, "rb") as file:
-                        image_data = file.read()
-                    img_b64_str = base64.b64encode(image_data).decode()
-                    response = requests.post(
-                        f"{base_url}/generate",
-                        json={
-                            "mesh": self.selected_mesh_base64,
-                            "image": img_b64_str,
-                            "octree_resolution": self.octree_resolution,
-                            "num_inference_steps": self.num_inference_steps,
-                            "guidance_scale": self.guidance_scale,
-                            "texture": self.texture 
-                        },
-                    )
-                else:
-                    self.report({'INFO'}, f"Post Texturing with Text")
-                    response = requests.post(
-                        f"{base_url}/generate",
-                        json={
-                            "mesh": self.selected_mesh_base64,
-                            "text": self.prompt,
-                            "octree_resolution": self.octree_resolution,
-                            "num_inference_steps": self.num_inference_steps,
-                            "guidance_scale": self.guidance_scale,
-                            "texture": self.texture
-                        },
-                    )
-            else:
-                if self.image_path:
-                    if not os.path.exists(self.image_path):
-                        self.report({'ERROR'}, f"Image path does not exist {self.image_path}")
-                        raise Exception(f'Image path does not exist {self.image_path}')
-                    self.report({'INFO'}, f"Post Start Image to 3D")
-                    with open(self.image_path, "rb") as file:
-                        image_data = file.read()
-                    img_b64_str = base64.b64encode(image_data).decode()
-                    response = requests.post(
-                        f"{base_url}/generate",
-                        json={
-                            "image": img_b64_str,
-                            "octree_resolution": self.octree_resolution,
-                            "num_inference_steps": self.num_inference_steps,
-                            "guidance_scale": self.guidance_scale,
-                            "texture": self.texture
-                        },
-                    )
-                else:
-                    self.report({'INFO'}, f"Post Start Text to 3D")
-                    response = requests.post(
-                        f"{base_url}/generate",
-                        json={
-                            "text": self.prompt,
-                            "octree_resolution": self.octree_resolution,
-                            "num_inference_steps": self.num_inference_steps,
-                            "guidance_scale": self.guidance_scale,
-                            "texture": self.texture 
-                        },
-                    )
-            self.report({'INFO'}, f"Post Done")
-
-            if response.status_code != 200:
-                self.report({'ERROR'}, f"Generation failed: {response.text}")
-                return
-
-            # Decode base64 and save to temporary file
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".glb")
-            temp_file.write(response.content)
-            temp_file.close()
-
-            # Import the GLB file in the main thread
-            def import_handler():
-                bpy.ops.import_scene.gltf(filepath=temp_file.name)
-                os.unlink(temp_file.name)
-
-                new_obj = bpy.context.selected_objects[0] if bpy.context.selected_objects else None
-                if new_obj and self.selected_mesh and self.texture:
-                    new_obj.location = self.selected_mesh.location
-                    new_obj.rotation_euler = self.selected_mesh.rotation_euler
-                    new_obj.scale = self.selected_mesh.scale
-
-                    self.selected_mesh.hide_set(True)
-                    self.selected_mesh.hide_render = True
-
-                return None
-
-            bpy.app.timers.register(import_handler)
+    def execute(self, context):
+        GenerationJob._mesh_cache.clear()
+        _cached_image_b64.cache_clear()
+        return {'FINISHED'}
 
-        except Exception as e:
-            self.report({'ERROR'}, f"Error: {str(e)}")
 
-        finally:
-            self.task_finished = True
-            self.selected_mesh_base64 = ""
+class Hunyuan3DPreferences(bpy.types.AddonPreferences):
+    bl_idname = __name__
+
+    def draw(self, context):
+        layout = self.layout
+        if HAS_PYBASE64:
+            layout.label(text="pybase64 found: using accelerated base64 encoding", icon='CHECKMARK')
+        else:
+            layout.label(text="Optional: install pybase64 into Blender's Python for faster uploads",
+                         icon='INFO')
+        if HAS_ORJSON:
+            layout.label(text="orjson found: using accelerated JSON encoding", icon='CHECKMARK')
+        else:
+            layout.label(text="Optional: install orjson into Blender's Python for faster uploads",
+                         icon='INFO')
+
+
+# (message, lines) of the last status drawn, so redraws don't re-split it
+_status_cache = ("", ())
+
+
+def _split_status(message):
+    global _status_cache
+    # RNA hands out a fresh str on every access, so compare by value
+    if _status_cache[0] != message:
+        _status_cache = (message, tuple(message.split("\n")) if message else ())
+    return _status_cache[1]
 
 
 class Hunyuan3DPanel(bpy.types.Panel):
@@ -280,27 +581,37 @@ class Hunyuan3DPanel(bpy.types.Panel):
         layout.prop(props, "num_inference_steps")
         layout.prop(props, "guidance_scale")
         #layout.prop(props, "texture")
+        layout.prop(props, "use_multipart")
 
         row = layout.row()
         row.enabled = not props.is_processing
         row.operator("object.generate_3d")
+        row.operator("object.hunyuan3d_clear_cache", text="", icon='TRASH')
 
-        if props.is_processing:
-            if props.status_message:
-                for line in props.status_message.split("\n"):
-                    layout.label(text=line)
-            else:
-                layout.label("Processing...")
+        status_lines = _split_status(props.status_message)
+        if status_lines:
+            for line in status_lines:
+                layout.label(text=line)
+        elif props.is_processing:
+            layout.label(text="Processing...")
 
 
 classes = (
+    Hunyuan3DPreferences,
     Hunyuan3DProperties,
     Hunyuan3DOperator,
+    Hunyuan3DClearCacheOperator,
     Hunyuan3DPanel,
 )
 
 
 def register():
+    global _SCRATCH_DIR
+    # mkdtemp gives a 0700 directory of our own, so the fixed file names below
+    # can't collide with, or be planted by, other users of the shared temp dir
+    _SCRATCH_DIR = tempfile.mkdtemp(prefix="hunyuan3d-")
+    atexit.register(_cleanup_tempfiles)
+
     for cls in classes:
         bpy.utils.register_class(cls)
     bpy.types.Scene.gen_3d_props = bpy.props.PointerProperty(type=Hunyuan3DProperties)
@@ -311,6 +622,9 @@ def unregister():
         bpy.utils.unregister_class(cls)
     del bpy.types.Scene.gen_3d_props
 
+    atexit.unregister(_cleanup_tempfiles)
+    _cleanup_tempfiles()
+
 
 if __name__ == "__main__":
     register()